@@ -5,13 +5,26 @@
 import argparse
 import atexit
 import curses
-import hashlib
+import dataclasses
+import gzip
 import os
 import pickle
 import textwrap
 import time
 import socket
 import sys
+import zlib
+
+# push a full pickled snapshot onto the undo stack every this many moves, deltas in between
+KEYFRAME_INTERVAL = 32
+
+# integer piece type tags, set as class attributes on the piece classes so hot
+# paths can index tables with an int instead of going through the glyph strings
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, EMPTY = range(7)
+
+# integer side encoding mirrored on every piece beside the side string, the
+# tight conway loops compare these ints while the ui keeps using the strings
+WHITE, BLACK, NO_SIDE = 0, 1, -1
 
 
 def exit_handler(engine, engine_state, conn, *args) -> None:
@@ -19,8 +32,8 @@ def exit_handler(engine, engine_state, conn, *args) -> None:
     type_, value, traceback = args
     print(type_, value, traceback, file=sys.stderr)
     print(" ".join(engine.recent_moves_str))
-    with open(engine.args.save, "wb") as f:
-        pickle.dump(engine_state, f)
+    with gzip.open(engine.args.save, "wb", compresslevel=3) as f:
+        pickle.dump(engine_state, f, protocol=5)
     if conn:
         conn.close()
 
@@ -104,17 +117,31 @@ def start_cli() -> int:
         atexit.register(conn.close)
     # engine initialization
     engine = Engine(args)
-    engine_state = [pickle.dumps(engine)]
+    engine_state = [(None, pickle.dumps(engine))]
     engine_state_redo = []
     if args.load:
-        engine_state = pickle.load(open(args.load, "rb"))
-        for i in range(len(engine_state)):
-            engine_state[i] = pickle.loads(engine_state[i])
-            engine_state[i].args = args
-            engine_state[i] = pickle.dumps(engine_state[i])
-        engine = pickle.loads(engine_state[-1])
+        try:
+            with gzip.open(args.load, "rb") as f:
+                engine_state = pickle.load(f)
+        except gzip.BadGzipFile:
+            # save file from before compression was added: either a delta log
+            # or, before that, a plain list of pickled engines
+            with open(args.load, "rb") as f:
+                engine_state = pickle.load(f)
+            if engine_state and isinstance(engine_state[0], bytes):
+                # keep the final snapshot as the sole keyframe since the old
+                # full-engine history does not map onto the delta log
+                engine_state = [(None, engine_state[-1])]
+        last_keyframe = max(i for i, entry in enumerate(engine_state) if entry[1] is not None)
+        engine = pickle.loads(engine_state[last_keyframe][1])
+        for delta, _ in engine_state[last_keyframe + 1:]:
+            engine.apply(delta)
+        # rebind the current cli args on the live engine only, the stored
+        # keyframes keep their originals since they are never run directly
+        engine.args = args
+        engine.board.args = args
     atexit.register(lambda: print(" ".join(engine.recent_moves_str)))
-    atexit.register(lambda: pickle.dump(engine_state, open(args.save, "wb")))
+    atexit.register(lambda: pickle.dump(engine_state, gzip.open(args.save, "wb", compresslevel=3), protocol=5))
     sys.excepthook = lambda *args: exit_handler(engine, engine_state, conn, *args)
     try:
         from stockfish import Stockfish
@@ -138,69 +165,83 @@ def start_cli() -> int:
             return 1
     return 1
 
-def main_loop(stdscr, engine: "Engine", engine_state: list[bytes], engine_state_redo: list[bytes], stockfish, conn, my_colour) -> int:
+def char_attr_tables(use_unicode: bool) -> tuple[dict, dict]:
+    """build color pair lookup tables for the board area of the display
+
+    one table for death counter rows and one for birth counter rows, they
+    only differ in how the digits are colored; unicode pieces keep the
+    default pair since their glyphs already encode the side
+    """
+    if use_unicode:
+        piece_attrs = {char: 0 for char in "RNBQKPrnbqkp"}
+    else:
+        piece_attrs = {char: 2 for char in "RNBQP"}
+        piece_attrs["K"] = 4
+        piece_attrs.update({char: 3 for char in "rnbqp"})
+        piece_attrs["k"] = 5
+    base_attrs = {**piece_attrs, "w": 9, "l": 9, "o": 7, "u": 7}
+    death_row_attrs = {**base_attrs, "0": 7, "1": 7, "2": 7, "3": 8}
+    birth_row_attrs = {**base_attrs, "0": 9, "1": 9, "2": 6}
+    return death_row_attrs, birth_row_attrs
+
+def main_loop(stdscr, engine: "Engine", engine_state: list[tuple], engine_state_redo: list[tuple], stockfish, conn, my_colour) -> int:
     """main loop for the curses implementation of the game"""
     curses.cbreak()
     curses.noecho()
+    death_row_attrs, birth_row_attrs = char_attr_tables(engine.use_unicode)
+    curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLUE)
+    curses.init_pair(2, curses.COLOR_BLUE, curses.COLOR_WHITE)
+    curses.init_pair(3, curses.COLOR_WHITE, curses.COLOR_BLUE)
+    curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_WHITE)
+    curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLUE)
+    curses.init_pair(6, curses.COLOR_GREEN, curses.COLOR_BLACK)
+    curses.init_pair(7, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+    curses.init_pair(8, curses.COLOR_RED, curses.COLOR_BLACK)
+    curses.init_pair(9, curses.COLOR_CYAN, curses.COLOR_BLACK)
     while True:
         # refresh screen
         current_display = engine.display(my_colour)
         stdscr.clear()
-        curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLUE)
-        curses.init_pair(2, curses.COLOR_BLUE, curses.COLOR_WHITE)
-        curses.init_pair(3, curses.COLOR_WHITE, curses.COLOR_BLUE)
-        curses.init_pair(4, curses.COLOR_YELLOW, curses.COLOR_WHITE)
-        curses.init_pair(5, curses.COLOR_YELLOW, curses.COLOR_BLUE)
-        curses.init_pair(6, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(7, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        curses.init_pair(8, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(9, curses.COLOR_CYAN, curses.COLOR_BLACK)
-        stdscr.attrset(curses.color_pair(0))
+        unicode_trans = engine._unicode_trans if engine.use_unicode else None
         y = 0
         for line in current_display:
+            if 4 < y < engine.height - 2:
+                row_attrs = death_row_attrs if (y - 5) % 4 == 2 else birth_row_attrs
+            else:
+                row_attrs = None
+            # coalesce consecutive characters sharing a color pair into one addstr call,
+            # swapping in the unicode pieces with one translate per run on board rows
+            run_start = 0
+            run_attr = 0
+            run_chars = []
             for x, char in enumerate(line):
-                # pieces
-                if char in "RNBQKP" and y > 4 and y < engine.height - 2:
-                    if engine.use_unicode:
-                        char = engine.unicode_replacements[char]
-                    else:
-                        if char == "K":
-                            stdscr.attrset(curses.color_pair(4))
-                        else:
-                            stdscr.attrset(curses.color_pair(2))
-                elif char in "rnbqkp" and y > 4 and y < engine.height - 2:
-                    if engine.use_unicode:
-                        char = engine.unicode_replacements[char]
-                    else:
-                        if char == "k":
-                            stdscr.attrset(curses.color_pair(5))
-                        else:
-                            stdscr.attrset(curses.color_pair(3))
-                # indicators
-                elif char in "wl" and y > 4 and y < engine.height - 2:
-                    stdscr.attrset(curses.color_pair(9))
-                elif char in "ou" and y > 4 and y < engine.height - 2:
-                    stdscr.attrset(curses.color_pair(7))
-                # death counters
-                elif char == "0" and x > 1 and x < engine.width - 1 and y > 4 and y < engine.height - 2 and (y - 5) % 4 == 2:
-                    stdscr.attrset(curses.color_pair(7))
-                elif char == "1" and x > 1 and x < engine.width - 1 and y > 4 and y < engine.height - 2 and (y - 5) % 4 == 2:
-                    stdscr.attrset(curses.color_pair(7))
-                elif char == "2" and x > 1 and x < engine.width - 1 and y > 4 and y < engine.height - 2 and (y - 5) % 4 == 2:
-                    stdscr.attrset(curses.color_pair(7))
-                elif char == "3" and x > 1 and x < engine.width - 1 and y > 4 and y < engine.height - 2 and (y - 5) % 4 == 2:
-                    stdscr.attrset(curses.color_pair(8))
-                # birth counters
-                elif char == "0" and x > 1 and x < engine.width - 1 and y > 4 and y < engine.height - 2 and (y - 5) % 4 != 2:
-                    stdscr.attrset(curses.color_pair(9))
-                elif char == "1" and x > 1 and x < engine.width - 1 and y > 4 and y < engine.height - 2 and (y - 5) % 4 != 2:
-                    stdscr.attrset(curses.color_pair(9))
-                elif char == "2" and x > 1 and x < engine.width - 1 and y > 4 and y < engine.height - 2 and (y - 5) % 4 != 2:
-                    stdscr.attrset(curses.color_pair(6))
-                # board
+                if row_attrs is None:
+                    attr = 0
+                else:
+                    attr = row_attrs.get(char, 0)
+                    if attr and "0" <= char <= "9" and not 1 < x < engine.width - 1:
+                        # rank labels at the board edges keep the default pair
+                        attr = 0
+                if len(char) > 1:
+                    # double digit counters overflow their cell, the next cell overwrites
+                    # the extra column when drawn per character, so keep one column here
+                    char = char[0]
+                if attr != run_attr:
+                    if run_chars:
+                        run_str = "".join(run_chars)
+                        if unicode_trans and row_attrs is not None:
+                            run_str = run_str.translate(unicode_trans)
+                        stdscr.addstr(y, run_start, run_str, curses.color_pair(run_attr))
+                    run_start = x
+                    run_attr = attr
+                    run_chars = [char]
                 else:
-                    stdscr.attrset(curses.color_pair(0))
-                stdscr.addstr(y, x, char)
+                    run_chars.append(char)
+            if run_chars:
+                run_str = "".join(run_chars)
+                if unicode_trans and row_attrs is not None:
+                    run_str = run_str.translate(unicode_trans)
+                stdscr.addstr(y, run_start, run_str, curses.color_pair(run_attr))
             y += 1
         stdscr.move(*engine.get_cursor())
         stdscr.refresh()
@@ -210,12 +251,12 @@ def main_loop(stdscr, engine: "Engine", engine_state: list[bytes], engine_state_
             if my_colour == engine.current_turn:
                 ch: int = stdscr.getch()
                 ch = engine.flip_cursor_y(ch, curses.KEY_UP, curses.KEY_DOWN)
-                conn.sendall(ch.to_bytes(2, "big") + hashlib.sha256(pickle.dumps(engine.recent_moves_str)).digest()[-2:])
+                conn.sendall(ch.to_bytes(2, "big") + engine._move_hash.to_bytes(4, "big")[-2:])
             else:
                 msg = conn.recv(4)
                 ch = int.from_bytes(msg[:2], "big")
                 hash_lsb = msg[2:]
-                assert hash_lsb == hashlib.sha256(pickle.dumps(engine.recent_moves_str)).digest()[-2:], f"client and server are out of sync"
+                assert hash_lsb == engine._move_hash.to_bytes(4, "big")[-2:], f"client and server are out of sync"
         else:
             ch: int = stdscr.getch()
             ch = engine.flip_cursor_y(ch, curses.KEY_UP, curses.KEY_DOWN)
@@ -233,13 +274,15 @@ def main_loop(stdscr, engine: "Engine", engine_state: list[bytes], engine_state_
             key = "right"
         elif ch == curses.KEY_BACKSPACE or ch == ord("u"):
             if len(engine_state) >= 2:
-                engine_state_redo.append(engine_state.pop())
-                engine = pickle.loads(engine_state[-1])
+                entry = engine_state.pop()
+                engine.revert(entry[0])
+                engine_state_redo.append(entry)
             continue
         elif ch == ord("r"):
             if engine_state_redo:
-                engine_state.append(engine_state_redo.pop())
-                engine = pickle.loads(engine_state[-1])
+                entry = engine_state_redo.pop()
+                engine.apply(entry[0])
+                engine_state.append(entry)
             continue
         elif ch == 27 or ch == ord("q"):
             key = "esc"
@@ -247,17 +290,42 @@ def main_loop(stdscr, engine: "Engine", engine_state: list[bytes], engine_state_
         else:
             key = "other"
         if engine.update_state(key, stockfish):
-            engine_state.append(pickle.dumps(engine))
+            keyframe = pickle.dumps(engine) if len(engine_state) % KEYFRAME_INTERVAL == 0 else None
+            engine_state.append((engine.last_delta, keyframe))
             engine_state_redo = []
 
 
+@dataclasses.dataclass
+class Move:
+    """lightweight delta for one accepted move, enough to revert or replay it"""
+    src_rc: tuple
+    dst_rc: tuple
+    move_str: str
+    captured: "Piece | None"
+    counters: list
+    births: list
+    deaths: list
+    turn_before: str
+    game_over_before: "str | None" = None
+    applied: bool = False
+    move_hash_before: int = 0
+
+
 class Engine:
+    __slots__ = (
+        "args", "board", "cursor_row", "cursor_col", "height", "width",
+        "white_birth_queue", "black_birth_queue", "selected_piece", "current_turn",
+        "col_labels", "recent_moves", "recent_moves_str", "last_delta",
+        "_move_hash", "_move_hash_prev", "game_over_message", "use_unicode",
+        "unicode_pieces", "ascii_pieces", "unicode_replacements", "_unicode_trans",
+        "_white_queue_str", "_black_queue_str"
+    )
+
     def __init__(self, args) -> None:
         self.args = args
         self.board = Board(self.args)
         # tick all the pieces for the first turn
-        for piece in self.board.get_pieces():
-            piece.tick(self.board.get_surrounding_pieces(piece), "white", True)
+        tick_pieces(self.board._pieces, self.board._empties, "white")
         self.cursor_row = 0
         self.cursor_col = 0
         self.height = len(self.board.display()) + 5
@@ -269,6 +337,10 @@ class Engine:
         self.col_labels = ["a", "b", "c", "d", "e", "f", "g", "h"]
         self.recent_moves = []
         self.recent_moves_str = []
+        self.last_delta = None
+        # incremental crc32 over the move strings, used to detect desync in networked games
+        self._move_hash = 0
+        self._move_hash_prev = 0
         self.game_over_message = None
         self.use_unicode = not self.args.ascii
         self.unicode_pieces = "♟♜♞♝♛♚♙♖♘♗♕♔"
@@ -276,9 +348,32 @@ class Engine:
         if self.args.light:
             self.ascii_pieces = "prnbqkPRNBQK"
         self.unicode_replacements = dict(zip(self.ascii_pieces, self.unicode_pieces))
+        # translation table for swapping whole strings to unicode pieces in one pass
+        self._unicode_trans = str.maketrans(self.ascii_pieces, self.unicode_pieces)
+        # cached birth queue header lines, invalidated whenever a queue rotates
+        self._white_queue_str = None
+        self._black_queue_str = None
         assert self.height == len(self.display(None))
         assert self.width == len(self.display(None)[0])
 
+    def __setstate__(self, state) -> None:
+        """restore from a pickle, filling in the fields that saves from before
+        the delta log and display caches do not carry"""
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for name, value in state.items():
+            setattr(self, name, value)
+        if "_move_hash" not in state:
+            self.last_delta = None
+            self._move_hash = 0
+            self._move_hash_prev = 0
+            for move_str in self.recent_moves_str:
+                self._move_hash_prev = self._move_hash
+                self._move_hash = zlib.crc32(move_str.encode(), self._move_hash)
+            self._unicode_trans = str.maketrans(self.ascii_pieces, self.unicode_pieces)
+            self._white_queue_str = None
+            self._black_queue_str = None
+
     def get_cursor(self) -> tuple[int, int]:
         """get the position of the cursor in terms of display row and column"""
         if self.args.flip:
@@ -311,12 +406,18 @@ class Engine:
         board.insert(1, list(header_2))
         header_3 = f"Recent moves: {' | '.join(self.recent_moves_str[-3:])}".center(self.width, " ")
         board.insert(2, list(header_3))
-        if self.use_unicode:
-            white_queue = f"White: {' '.join([self.unicode_replacements[piece] for piece in self.white_birth_queue])}".center(self.width, " ")
-            black_queue = f"Black: {' '.join([self.unicode_replacements[piece.lower()] for piece in self.black_birth_queue])}".center(self.width, " ")
-        else:
-            white_queue = f"White: {' '.join(self.white_birth_queue)}".center(self.width, " ")
-            black_queue = f"Black: {' '.join(self.black_birth_queue)}".center(self.width, " ")
+        if self._white_queue_str is None:
+            if self.use_unicode:
+                self._white_queue_str = f"White: {' '.join(self.white_birth_queue).translate(self._unicode_trans)}".center(self.width, " ")
+            else:
+                self._white_queue_str = f"White: {' '.join(self.white_birth_queue)}".center(self.width, " ")
+        if self._black_queue_str is None:
+            if self.use_unicode:
+                self._black_queue_str = f"Black: {' '.join(self.black_birth_queue).lower().translate(self._unicode_trans)}".center(self.width, " ")
+            else:
+                self._black_queue_str = f"Black: {' '.join(self.black_birth_queue)}".center(self.width, " ")
+        white_queue = self._white_queue_str
+        black_queue = self._black_queue_str
         if self.args.flip:
             board.insert(3, list(black_queue))
             board.append(list(white_queue))
@@ -325,6 +426,13 @@ class Engine:
             board.append(list(black_queue))
         return board
 
+    def log_move(self, source, dest, move_str: str) -> None:
+        """record an accepted move and roll it into the incremental desync hash"""
+        self.recent_moves.append((source, dest))
+        self.recent_moves_str.append(move_str)
+        self._move_hash_prev = self._move_hash
+        self._move_hash = zlib.crc32(move_str.encode(), self._move_hash)
+
     def move_is_valid(self, source, dest, stockfish) -> bool:
         source_row = source.row + 1
         source_col = self.col_labels[source.col]
@@ -336,18 +444,15 @@ class Engine:
                 try:
                     stockfish.set_fen_position(self.board.get_fen_position(self.current_turn))
                     if stockfish.is_move_correct(f"{source_col}{source_row}{dest_col}{dest_row}"):
-                        self.recent_moves.append((source, dest))
-                        self.recent_moves_str.append(move_str)
+                        self.log_move(source, dest, move_str)
                         return True
                     else:
                         return False
                 except:
-                    self.recent_moves.append((source, dest))
-                    self.recent_moves_str.append(move_str)
+                    self.log_move(source, dest, move_str)
                     return True
             else:
-                self.recent_moves.append((source, dest))
-                self.recent_moves_str.append(move_str)
+                self.log_move(source, dest, move_str)
                 return True
         else:
             return False
@@ -374,62 +479,236 @@ class Engine:
                             self.cursor_row = int(move[3]) - 1
                             self.cursor_col = ord(move[2]) - ord("a")
                             key = "enter"
+                    elif not (self.args.host or self.args.join):
+                        # fall back to the built in search when stockfish isn't installed,
+                        # but not over the network where each peer would run its own
+                        # nondeterministic search and desync
+                        move = self.search_best_move()
+                        if move is not None:
+                            self.selected_piece = self.board.get_piece(*move[0])
+                            self.cursor_row, self.cursor_col = move[1]
+                            key = "enter"
                 except:
                     pass
             if key == "enter":
+                target = self.board.get_piece(self.cursor_row, self.cursor_col)
                 if self.selected_piece is None:
                     # select a piece
-                    if self.board.get_piece(self.cursor_row, self.cursor_col).side == self.current_turn:
-                        self.selected_piece = self.board.get_piece(self.cursor_row, self.cursor_col)
-                elif self.move_is_valid(self.selected_piece, self.board.get_piece(self.cursor_row, self.cursor_col), stockfish):
+                    if target.side == self.current_turn:
+                        self.selected_piece = target
+                elif self.move_is_valid(self.selected_piece, target, stockfish):
                     # move the selected piece to the cursor
-                    try:
-                        self.board.move_piece(self.selected_piece, self.board.get_piece(self.cursor_row, self.cursor_col))
-                    except Exception as e:
-                        self.game_over_message = str(e)
-                        return False
-                    self.selected_piece = None
-                    self.current_turn = "black" if self.current_turn == "white" else "white"
-                    # tick all the pieces at the start of the next turn
-                    for piece in self.board.get_pieces():
-                        piece.tick(self.board.get_surrounding_pieces(piece), self.current_turn, True)
-                    # check if any pieces need to be born
-                    if self.current_turn == "white":
-                        for i in range(8):
-                            for j in range(8):
-                                piece = self.board.get_piece(i, j)
-                                if piece.side == "empty":
-                                    if piece.birth_counter_white == 3:
-                                        next_piece = self.white_birth_queue.pop(0)
-                                        self.board.set_new_piece(i, j, next_piece, "white")
-                                        self.white_birth_queue.append(next_piece)
-                    elif self.current_turn == "black":
-                        for i in reversed(range(8)):
-                            for j in range(8):
-                                piece = self.board.get_piece(i, j)
-                                if piece.side == "empty":
-                                    if piece.birth_counter_black == 3:
-                                        next_piece = self.black_birth_queue.pop(0)
-                                        self.board.set_new_piece(i, j, next_piece, "black")
-                                        self.black_birth_queue.append(next_piece)
-                    # check if any pieces need to die
-                    for piece in self.board.get_pieces():
-                        if piece.death_counter == 4:
-                            try:
-                                self.board.kill_piece(piece, self.current_turn)
-                            except Exception as e:
-                                self.game_over_message = str(e)
-                                return False
-                    # recalculate nearby pieces for indicators
-                    for piece in self.board.get_pieces():
-                        piece.tick(self.board.get_surrounding_pieces(piece), self.current_turn, False)
+                    self.last_delta = self._execute_move(self.selected_piece, target)
                     return True
             if key == "other":
                 self.selected_piece = None
         return False
 
+    def search_best_move(self, time_limit: float = 2.0) -> "tuple | None":
+        """pick a move with iterative deepening negamax, used when stockfish is unavailable
+
+        moves are simulated through the same delta machinery as real play so
+        the conway phase is searched exactly, then reverted; returns the move
+        as ((source_row, source_col), (dest_row, dest_col)) or None
+        """
+        if self.game_over_message:
+            return None
+        deadline = time.monotonic() + time_limit
+        transpositions = {}
+        best_move = None
+        for depth in range(1, 5):
+            best_score = float("-inf")
+            depth_best = None
+            # search the previous iteration's best move first for better cutoffs
+            moves = self._search_moves(first=best_move)
+            for source_rc, dest_rc in moves:
+                if time.monotonic() > deadline:
+                    depth_best = None
+                    break
+                delta = self._make_search_move(source_rc, dest_rc)
+                if self.game_over_message:
+                    # every game end after a move is a win for the mover
+                    score = 10000 + depth
+                elif depth_best is None:
+                    # first move establishes the score with a full window
+                    score = -self._negamax(depth - 1, float("-inf"), -best_score, transpositions)
+                else:
+                    # scout the siblings with a null window, re-search on a fail high
+                    score = -self._negamax(depth - 1, -(best_score + 1), -best_score, transpositions)
+                    if score > best_score:
+                        score = -self._negamax(depth - 1, float("-inf"), -best_score, transpositions)
+                self.revert(delta)
+                if score > best_score:
+                    best_score = score
+                    depth_best = (source_rc, dest_rc)
+            if depth_best is None:
+                break
+            best_move = depth_best
+        return best_move
+
+    def _negamax(self, depth: int, alpha: float, beta: float, transpositions: dict) -> float:
+        """fail-hard alpha-beta negamax over the conway chess game tree"""
+        if depth == 0:
+            return self._evaluate()
+        key = (self.board.pack(), self.current_turn)
+        entry = transpositions.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, flag, value = entry
+            if flag == 0:
+                return value
+            elif flag == 1 and value >= beta:
+                return beta
+            elif flag == 2 and value <= alpha:
+                return alpha
+        alpha_orig = alpha
+        for source_rc, dest_rc in self._search_moves():
+            delta = self._make_search_move(source_rc, dest_rc)
+            if self.game_over_message:
+                score = 10000 + depth
+            else:
+                score = -self._negamax(depth - 1, -beta, -alpha, transpositions)
+            self.revert(delta)
+            if score >= beta:
+                transpositions[key] = (depth, 1, beta)
+                return beta
+            if score > alpha:
+                alpha = score
+        transpositions[key] = (depth, 2 if alpha == alpha_orig else 0, alpha)
+        return alpha
+
+    def _search_moves(self, first: "tuple | None" = None) -> list:
+        """generate the side to move's moves as position pairs, captures ordered first"""
+        moves = []
+        for piece in self.board.get_pieces():
+            if piece.side != self.current_turn:
+                continue
+            src = (piece.row, piece.col)
+            for row in self.board.board:
+                for target in row:
+                    if piece.move_is_valid(target):
+                        moves.append((PIECE_VALUES[target.piece_type], src, (target.row, target.col)))
+        moves.sort(key=lambda m: m[0], reverse=True)
+        ordered = [(src, dst) for _, src, dst in moves]
+        if first is not None and first in ordered:
+            ordered.remove(first)
+            ordered.insert(0, first)
+        return ordered
+
+    def _make_search_move(self, source_rc: tuple, dest_rc: tuple) -> "Move":
+        """log and execute a move for the search, callers revert the returned delta"""
+        source = self.board.get_piece(*source_rc)
+        dest = self.board.get_piece(*dest_rc)
+        move_str = f"{source}{self.col_labels[source.col]}{source.row + 1}->{dest}{self.col_labels[dest.col]}{dest.row + 1}"
+        self.log_move(source, dest, move_str)
+        return self._execute_move(source, dest)
+
+    def _evaluate(self) -> int:
+        """material balance from the side to move's perspective"""
+        material = 0
+        for piece in self.board.get_pieces():
+            value = PIECE_VALUES[piece.piece_type]
+            material += value if piece.side_bit == WHITE else -value
+        return material if self.current_turn == "white" else -material
+
+    def _execute_move(self, source: "Piece", dest: "Piece") -> "Move":
+        """move the piece and run the conway phase, recording a delta for undo"""
+        delta = Move(source.get_position(), dest.get_position(), self.recent_moves_str[-1],
+                     dest if dest.side != "empty" else None, self._snapshot_counters(), [], [],
+                     self.current_turn, self.game_over_message, move_hash_before=self._move_hash_prev)
+        self.selected_piece = None
+        message = self.board.move_piece(source, dest)
+        if message is not None:
+            # the king was captured before any board mutation, nothing to revert but the move log
+            self.game_over_message = message
+            return delta
+        delta.applied = True
+        self.current_turn = "black" if self.current_turn == "white" else "white"
+        # tick all the pieces at the start of the next turn, collecting births and deaths
+        births, deaths = tick_pieces(self.board._pieces, self.board._empties, self.current_turn)
+        # birth new pieces in order of rank then file from the player's side
+        if self.current_turn == "white":
+            for piece in sorted(births, key=lambda p: (p.row, p.col)):
+                next_piece = self.white_birth_queue.pop(0)
+                self.board.set_new_piece(piece.row, piece.col, next_piece, "white")
+                self.white_birth_queue.append(next_piece)
+                self._white_queue_str = None
+                delta.births.append((piece.row, piece.col))
+        elif self.current_turn == "black":
+            for piece in sorted(births, key=lambda p: (-p.row, p.col)):
+                next_piece = self.black_birth_queue.pop(0)
+                self.board.set_new_piece(piece.row, piece.col, next_piece, "black")
+                self.black_birth_queue.append(next_piece)
+                self._black_queue_str = None
+                delta.births.append((piece.row, piece.col))
+        # apply the deaths in grid order so a king death cuts off deterministically
+        for piece in sorted(deaths, key=lambda p: (p.row, p.col)):
+            message = self.board.kill_piece(piece, self.current_turn)
+            if message is not None:
+                # the king perished before leaving the board, everything recorded so far is revertible
+                self.game_over_message = message
+                return delta
+            if piece.side == self.current_turn:
+                delta.deaths.append(piece)
+        # the indicators stay current since the board maintains the neighbor counts incrementally
+        return delta
+
+    def _snapshot_counters(self) -> list:
+        """record every square's counters so a delta can be reverted exactly"""
+        return [(piece.row, piece.col, piece.death_counter, piece.birth_counter_white,
+                 piece.birth_counter_black, piece.surrounding_white, piece.surrounding_black)
+                for row in self.board.board for piece in row]
+
+    def apply(self, delta: "Move") -> None:
+        """replay a recorded move (redo), the conway phase is deterministic so it is re-run"""
+        source = self.board.get_piece(*delta.src_rc)
+        dest = self.board.get_piece(*delta.dst_rc)
+        self.log_move(source, dest, delta.move_str)
+        self._execute_move(source, dest)
+
+    def revert(self, delta: "Move") -> None:
+        """undo a recorded move by restoring the board and counters in place"""
+        if delta.applied:
+            # restore pieces that died of over/under population
+            for piece in delta.deaths:
+                self.board.put_piece(piece.row, piece.col, piece)
+            # remove pieces that were born and un-rotate the birth queue
+            queue = self.black_birth_queue if delta.turn_before == "white" else self.white_birth_queue
+            for row, col in delta.births:
+                self.board.put_piece(row, col, Empty())
+                queue.insert(0, queue.pop())
+            if delta.births:
+                if delta.turn_before == "white":
+                    self._black_queue_str = None
+                else:
+                    self._white_queue_str = None
+            # move the piece back and restore any captured piece, vacating the
+            # destination first so the moved piece is never tracked on two squares
+            moved_piece = self.board.get_piece(*delta.dst_rc)
+            self.board.put_piece(delta.dst_rc[0], delta.dst_rc[1], delta.captured if delta.captured is not None else Empty())
+            self.board.put_piece(delta.src_rc[0], delta.src_rc[1], moved_piece)
+            # restore every square's counters
+            for row, col, death, birth_white, birth_black, surr_white, surr_black in delta.counters:
+                piece = self.board.get_piece(row, col)
+                piece.death_counter = death
+                piece.birth_counter_white = birth_white
+                piece.birth_counter_black = birth_black
+                piece.surrounding_white = surr_white
+                piece.surrounding_black = surr_black
+            self.current_turn = delta.turn_before
+        self.recent_moves.pop()
+        self.recent_moves_str.pop()
+        self._move_hash = delta.move_hash_before
+        self.selected_piece = None
+        self.game_over_message = delta.game_over_before
+
 
 class Board:
+    __slots__ = (
+        "args", "board", "piece_width", "piece_height", "_pieces", "_empties",
+        "_white_bb", "_black_bb", "_fen_board",
+        "_display_top", "_display_separator", "_display_bottom", "_display_files"
+    )
+
     def __init__(self, args) -> None:
         self.args = args
         self.board: list[list[Piece]] = [[Empty() for x in range(8)] for y in range(8)]
@@ -460,120 +739,243 @@ class Board:
         for i in range(8):
             for j in range(8):
                 self.board[i][j].set_position(i, j)
+        self._rebuild_derived()
+
+    def __setstate__(self, state) -> None:
+        """restore from a pickle, rebuilding the caches that saves from before
+        the incremental bookkeeping was added do not carry"""
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for name, value in state.items():
+            setattr(self, name, value)
+        if "_pieces" not in state:
+            self._rebuild_derived()
+
+    def _rebuild_derived(self) -> None:
+        """rebuild everything derived from the grid: the piece sets, occupancy
+        bitboards, neighbor counts, fen cache, and the static ui chrome"""
+        # cached board portion of the fen string, invalidated whenever the board changes
+        self._fen_board = None
+        # all non-empty pieces and all empty squares, maintained incrementally,
+        # plus per side occupancy bitboards (bit row * 8 + col set when occupied)
+        self._pieces = set()
+        self._empties = set()
+        self._white_bb = 0
+        self._black_bb = 0
+        for i in range(8):
+            for j in range(8):
+                if self.board[i][j].side == "empty":
+                    self._empties.add(self.board[i][j])
+                else:
+                    self._pieces.add(self.board[i][j])
+                    if self.board[i][j].side == "white":
+                        self._white_bb |= 1 << (i * 8 + j)
+                    else:
+                        self._black_bb |= 1 << (i * 8 + j)
+        for i in range(8):
+            for j in range(8):
+                self._count_surroundings(self.board[i][j])
+        # static parts of the ui grid, built once and shared between frames
+        WIDTH = self.piece_width
+        self._display_top = [" ", "┌"] + (["─"] * WIDTH + ["┬"]) * 7 + ["─"] * WIDTH + ["┐", " "]
+        self._display_separator = [" ", "├"] + (["─"] * WIDTH + ["┼"]) * 7 + ["─"] * WIDTH + ["┤", " "]
+        self._display_bottom = [" ", "└"] + (["─"] * WIDTH + ["┴"]) * 7 + ["─"] * WIDTH + ["┘", " "]
+        self._display_files = [" ", " ", " "] + list("     ".join(list("abcdefgh"))) + [" ", " ", " "]
 
     def get_fen_position(self, current_turn: str) -> str:
         # return a string in Forsyth-Edwards Notation (FEN)
-        fen = ""
-        for row in reversed(self.board):
-            empty_spaces = 0
+        if self._fen_board is None:
+            rows = []
+            for row in reversed(self.board):
+                parts = []
+                empty_spaces = 0
+                for piece in row:
+                    if piece.side == "empty":
+                        empty_spaces += 1
+                    else:
+                        if empty_spaces > 0:
+                            parts.append(str(empty_spaces))
+                            empty_spaces = 0
+                        parts.append(piece.glyph)
+                if empty_spaces > 0:
+                    parts.append(str(empty_spaces))
+                rows.append("".join(parts))
+            self._fen_board = "/".join(rows)
+        return self._fen_board + " " + current_turn[0] + " - - 0 1"
+
+    def pack(self) -> bytes:
+        """pack the position into 96 bytes, a 4 bit piece nibble per square plus
+        a byte per square folding in the life cycle counters, cheap to build and
+        hash compared to the fen string and counter tuples it replaces as the
+        search's transposition key"""
+        packed = bytearray(96)
+        sq = 0
+        for row in self.board:
             for piece in row:
-                if piece.side == "empty":
-                    empty_spaces += 1
+                nibble = piece.piece_type | ((piece.side_bit & 1) << 3)
+                if sq & 1:
+                    packed[sq >> 1] |= nibble << 4
                 else:
-                    if empty_spaces > 0:
-                        fen += str(empty_spaces)
-                        empty_spaces = 0
-                    fen += str(piece)
-            if empty_spaces > 0:
-                fen += str(empty_spaces)
-            fen += "/"
-        fen = fen[:-1]
-        fen += " " + current_turn[0] + " - - 0 1"
-        return fen
+                    packed[sq >> 1] = nibble
+                packed[32 + sq] = ((piece.death_counter & 7) | ((piece.birth_counter_white & 3) << 3)
+                                   | ((piece.birth_counter_black & 3) << 5))
+                sq += 1
+        return bytes(packed)
 
     def get_piece(self, row: int, col: int) -> "Piece":
         return self.board[row][col]
 
-    def get_pieces(self) -> list["Piece"]:
-        pieces = []
-        for row in self.board:
-            for piece in row:
-                pieces.append(piece)
-        return pieces
+    def get_pieces(self) -> set["Piece"]:
+        return self._pieces
 
     def get_surrounding_pieces(self, piece: "Piece") -> list["Piece"]:
-        surrounding_pieces = []
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if i == 0 and j == 0:
-                    continue
-                elif 0 <= piece.row + i < 8 and 0 <= piece.col + j < 8:
-                    surrounding_pieces.append(self.board[piece.row + i][piece.col + j])
-        return surrounding_pieces
+        board = self.board
+        return [board[row][col] for row, col in NEIGHBOR_COORDS[piece.row * 8 + piece.col]]
+
+    def _count_surroundings(self, piece: "Piece") -> None:
+        """recompute a single piece's neighbor counts from the occupancy bitboards"""
+        mask = KING_NEIGHBORS[piece.row * 8 + piece.col]
+        piece.surrounding_white = (self._white_bb & mask).bit_count()
+        piece.surrounding_black = (self._black_bb & mask).bit_count()
+
+    def _update_neighbor_counts(self, piece: "Piece", delta: int) -> None:
+        """a piece entered (delta=1) or left (delta=-1) its square, adjust its neighbors' counts"""
+        board = self.board
+        if piece.side_bit == WHITE:
+            for row, col in NEIGHBOR_COORDS[piece.row * 8 + piece.col]:
+                board[row][col].surrounding_white += delta
+        elif piece.side_bit == BLACK:
+            for row, col in NEIGHBOR_COORDS[piece.row * 8 + piece.col]:
+                board[row][col].surrounding_black += delta
 
     def set_new_piece(self, row: int, col: int, piece: str, side: str) -> None:
-        if piece == "P":
-            self.board[row][col] = Pawn(side)
-        elif piece == "R":
-            self.board[row][col] = Rook(side)
-        elif piece == "N":
-            self.board[row][col] = Knight(side)
-        elif piece == "B":
-            self.board[row][col] = Bishop(side)
-        elif piece == "Q":
-            self.board[row][col] = Queen(side)
-        elif piece == "K":
-            self.board[row][col] = King(side)
-        else:
+        ctor = _PIECE_CTORS.get(piece)
+        if ctor is None:
             raise ValueError("invalid piece")
-        self.board[row][col].set_position(row, col)
+        new_piece = ctor(side)
+        self._fen_board = None
+        if side == "white":
+            self._white_bb |= 1 << (row * 8 + col)
+        else:
+            self._black_bb |= 1 << (row * 8 + col)
+        self._empties.discard(self.board[row][col])
+        self._pieces.add(new_piece)
+        self.board[row][col] = new_piece
+        new_piece.set_position(row, col)
+        self._count_surroundings(new_piece)
+        self._update_neighbor_counts(new_piece, 1)
+
+    def put_piece(self, row: int, col: int, piece: "Piece") -> None:
+        """place a piece (or Empty) directly on a square, used when reverting deltas"""
+        old_piece = self.board[row][col]
+        self._fen_board = None
+        sq_bit = 1 << (row * 8 + col)
+        self._white_bb &= ~sq_bit
+        self._black_bb &= ~sq_bit
+        if piece.side == "white":
+            self._white_bb |= sq_bit
+        elif piece.side == "black":
+            self._black_bb |= sq_bit
+        self._pieces.discard(old_piece)
+        self._empties.discard(old_piece)
+        (self._empties if piece.side == "empty" else self._pieces).add(piece)
+        self._update_neighbor_counts(old_piece, -1)
+        self.board[row][col] = piece
+        piece.set_position(row, col)
+        self._count_surroundings(piece)
+        self._update_neighbor_counts(piece, 1)
 
-    def kill_piece(self, piece: "Piece", turn: str) -> None:
-        """piece died due to over/under population"""
+    def kill_piece(self, piece: "Piece", turn: str) -> "str | None":
+        """piece died due to over/under population, returns a game over message
+        if it was the king, leaving it on the board like any other game end"""
         if piece.side == turn:
             row = piece.row
             col = piece.col
-            self.board[row][col].perish(conway=True)
-            self.board[row][col] = Empty()
-            self.board[row][col].set_position(row, col)
+            message = self.board[row][col].perish(conway=True)
+            if message is not None:
+                return message
+            self._fen_board = None
+            if piece.side == "white":
+                self._white_bb &= ~(1 << (row * 8 + col))
+            else:
+                self._black_bb &= ~(1 << (row * 8 + col))
+            self._update_neighbor_counts(piece, -1)
+            self._pieces.discard(piece)
+            empty = Empty()
+            self._empties.add(empty)
+            self.board[row][col] = empty
+            empty.set_position(row, col)
+            self._count_surroundings(empty)
 
     def display(self) -> list:
         """get a version of the board suitable for printing to the ui"""
-        # use ascii art to create a grid between the pieces
-        WIDTH = self.piece_width
-        HEIGHT = self.piece_height
-        middle = ["─"] * WIDTH + ["┬"]
-        board = [["┌"] + middle * 7 + ["─"] * WIDTH + ["┐"]]
-        for row in reversed(self.board) if self.args.flip else self.board:
-            board += [["│"], ["│"], ["│"]]
+        # only the piece cells change between frames, the grid rows are prebuilt and shared
+        board = [self._display_files, self._display_top]
+        rows = reversed(self.board) if self.args.flip else self.board
+        for i, row in enumerate(rows):
+            rank = str(8 - i) if self.args.flip else str(i + 1)
+            line_1, line_2, line_3 = [" ", "│"], [rank, "│"], [" ", "│"]
             for piece in row:
-                board[-3] += piece.display()[0] + ["│"]
-                board[-2] += piece.display()[1] + ["│"]
-                board[-1] += piece.display()[2] + ["│"]
-            middle = ["─"] * WIDTH + ["┼"]
-            board += [["├"] + middle * 7 + ["─"] * WIDTH + ["┤"]]
-        _ = board.pop()
-        middle = ["─"] * WIDTH + ["┴"]
-        board += [["└"] + middle * 7 + ["─"] * WIDTH + ["┘"]]
-        # add the row and column numbers, NOTE: need to readjust if changing piece size
-        for i in range(len(board)):
-            if self.args.flip:
-                board[i] = [str(9 - ((i + 2) // 4)) if (i + 2) % 4 == 0 else " "] + board[i] + [str(9 - ((i + 2) // 4)) if (i + 2) % 4 == 0 else " "]
-            else:
-                board[i] = [str((i + 2) // 4) if (i + 2) % 4 == 0 else " "] + board[i] + [str((i + 2) // 4) if (i + 2) % 4 == 0 else " "]
-        board = [[" ", " ", " "] + list("     ".join(list("abcdefgh"))) + [" ", " ", " "]] + board
-        board += [[" ", " ", " "] + list("     ".join(list("abcdefgh"))) + [" ", " ", " "]]
+                chars = piece.display()
+                line_1 += chars[0] + ["│"]
+                line_2 += chars[1] + ["│"]
+                line_3 += chars[2] + ["│"]
+            line_1.append(" ")
+            line_2.append(rank)
+            line_3.append(" ")
+            board += [line_1, line_2, line_3]
+            board.append(self._display_separator if i < 7 else self._display_bottom)
+        board.append(self._display_files)
         return board
 
-    def move_piece(self, source: "Piece", dest: "Piece") -> bool:
-        """moves piece and returns whether move is successful"""
-        if not source.move_is_valid(dest):
-            return False
+    def move_piece(self, source: "Piece", dest: "Piece") -> "str | None":
+        """moves a piece the caller has already validated, returns a game over message
+        on a king capture without mutating the board so the game ends on the final
+        position, and None on success"""
+        assert source.move_is_valid(dest), f"invalid move {source.side} {source.get_position()} -> {dest.get_position()}"
         # check if the move is a capture and move the piece
-        self.board[dest.row][dest.col].perish(conway=False)
+        message = self.board[dest.row][dest.col].perish(conway=False)
+        if message is not None:
+            return message
+        self._fen_board = None
+        src_bit = 1 << (source.row * 8 + source.col)
+        dst_bit = 1 << (dest.row * 8 + dest.col)
+        if source.side == "white":
+            self._white_bb = (self._white_bb & ~src_bit) | dst_bit
+            self._black_bb &= ~dst_bit
+        else:
+            self._black_bb = (self._black_bb & ~src_bit) | dst_bit
+            self._white_bb &= ~dst_bit
+        self._update_neighbor_counts(dest, -1)
+        self._update_neighbor_counts(source, -1)
+        self._pieces.discard(dest)
+        self._empties.discard(dest)
         self.board[dest.row][dest.col] = source
         # replace the old position with an empty piece
-        self.board[source.row][source.col] = Empty()
-        self.board[source.row][source.col].set_position(source.row, source.col)
-        # update the position of the moved piece
+        empty = Empty()
+        self._empties.add(empty)
+        self.board[source.row][source.col] = empty
+        empty.set_position(source.row, source.col)
+        # update the position of the moved piece and refresh the affected counts
         source.set_position(dest.row, dest.col)
-        return True
+        self._update_neighbor_counts(source, 1)
+        self._count_surroundings(empty)
+        self._count_surroundings(source)
+        return None
 
 
 class Piece:
+    __slots__ = (
+        "side", "side_bit", "glyph", "row", "col", "death_counter", "birth_counter_white",
+        "birth_counter_black", "surrounding_white", "surrounding_black",
+        "_display_key", "_display_cache"
+    )
+
     def __init__(self, side) -> None:
         """common attributes (required by every chess piece)"""
         self.side = side
+        self.side_bit = WHITE if side == "white" else BLACK if side == "black" else NO_SIDE
+        self.glyph = GLYPHS[self.piece_type][self.side_bit]
         self.row = -1
         self.col = -1
         self.death_counter = 0
@@ -581,10 +983,26 @@ class Piece:
         self.birth_counter_black = 0
         self.surrounding_white = 0
         self.surrounding_black = 0
+        # memoized display cell and the counter values it was built from
+        self._display_key = None
+        self._display_cache = None
+
+    def __setstate__(self, state) -> None:
+        """restore from a pickle, deriving the slots that saves from before the
+        integer side and glyph encodings do not carry"""
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for name, value in state.items():
+            setattr(self, name, value)
+        if "side_bit" not in state:
+            self.side_bit = WHITE if self.side == "white" else BLACK if self.side == "black" else NO_SIDE
+            self.glyph = GLYPHS[self.piece_type][self.side_bit]
+            self._display_key = None
+            self._display_cache = None
 
     def __str__(self) -> str:
         """for displaying entities on the map ui"""
-        raise NotImplementedError()
+        return self.glyph
 
     def set_position(self, row: int, col: int) -> None:
         """set the position of the piece"""
@@ -597,6 +1015,11 @@ class Piece:
 
     def display(self) -> list[list[str]]:
         """get a 3x3 list of chars of the piece suitable for printing to the ui"""
+        # the cell only depends on the counters, reuse it while they are unchanged
+        key = (self.death_counter, self.birth_counter_white, self.birth_counter_black,
+               self.surrounding_white, self.surrounding_black)
+        if key == self._display_key:
+            return self._display_cache
         white_reproduction = "w" if self.side == "empty" and self.surrounding_white == 3 else " "
         black_reproduction = "l" if self.side == "empty" and self.surrounding_black == 3 else " "
         over_under_population = " "
@@ -612,122 +1035,154 @@ class Piece:
                 over_under_population = "o"
         chars_to_print = [
             [" " if white_reproduction == " " else str(self.birth_counter_white), " ", " ", " ", white_reproduction],
-            [" " if over_under_population == " " else str(self.death_counter), " ", str(self), " ", over_under_population],
+            [" " if over_under_population == " " else str(self.death_counter), " ", self.glyph, " ", over_under_population],
             [" " if black_reproduction == " " else str(self.birth_counter_black), " ", " ", " ", black_reproduction]
         ]
+        self._display_key = key
+        self._display_cache = chars_to_print
         return chars_to_print
 
     def move_is_valid(self, dest_piece: "Piece") -> bool:
         """check if the move is valid, TODO: check with chess logic, and add special moves"""
-        if dest_piece.side == self.side:
-            return False
-        elif dest_piece.side == "empty":
-            return True
-        else:
-            return True
+        return dest_piece.side_bit != self.side_bit
 
-    def tick(self, surrounding_pieces: list["Piece"], current_turn: str, update_counters: bool) -> None:
-        """perform next step in life cycle, only ticks for players pieces before their turn"""
-        self.surrounding_white = 0
-        self.surrounding_black = 0
-        for piece in surrounding_pieces:
-            if piece.side == "white":
-                self.surrounding_white += 1
-            elif piece.side == "black":
-                self.surrounding_black += 1
-        if not update_counters:
-            return
-        if self.side == "empty":
-            if current_turn == "white":
-                if self.surrounding_white == 3:
-                    self.birth_counter_white += 1
-                else:
-                    self.birth_counter_white = 0
-            if current_turn == "black":
-                if self.surrounding_black == 3:
-                    self.birth_counter_black += 1
-                else:
-                    self.birth_counter_black = 0
-        elif current_turn == self.side:
-            same_pieces = 0
-            for piece in surrounding_pieces:
-                if piece.side == self.side:
-                    same_pieces += 1
-            if same_pieces < 2 or same_pieces > 3:
-                self.death_counter += 1
-            else:
-                self.death_counter = 0
-
-    def perish(self, conway: bool) -> None:
-        """piece perished due to over/under population (conway=True) or capture (conway=False)"""
-        pass
+    def perish(self, conway: bool) -> "str | None":
+        """piece perished due to over/under population (conway=True) or capture (conway=False),
+        returns a game over message if the piece was a king"""
+        return None
 
 class Empty(Piece):
+    __slots__ = ()
+    piece_type = EMPTY
+
     def __init__(self) -> None:
         """empty space on the map"""
         super().__init__("empty")
-    
-    def __str__(self) -> str:
-        return " "
 
     def move_is_valid(self, dest_piece: Piece) -> bool:
         return False
 
 class Pawn(Piece):
+    __slots__ = ()
+    piece_type = PAWN
+
     def __init__(self, side) -> None:
         """pawn chess piece"""
         super().__init__(side)
-    
-    def __str__(self) -> str:
-        return "P" if self.side == "white" else "p"
 
 class Knight(Piece):
+    __slots__ = ()
+    piece_type = KNIGHT
+
     def __init__(self, side) -> None:
         """knight chess piece"""
         super().__init__(side)
-    
-    def __str__(self) -> str:
-        return "N" if self.side == "white" else "n"
 
 class Bishop(Piece):
+    __slots__ = ()
+    piece_type = BISHOP
+
     def __init__(self, side) -> None:
         """bishop chess piece"""
         super().__init__(side)
-    
-    def __str__(self) -> str:
-        return "B" if self.side == "white" else "b"
 
 class Rook(Piece):
+    __slots__ = ()
+    piece_type = ROOK
+
     def __init__(self, side) -> None:
         """rook chess piece"""
         super().__init__(side)
-    
-    def __str__(self) -> str:
-        return "R" if self.side == "white" else "r"
 
 class Queen(Piece):
+    __slots__ = ()
+    piece_type = QUEEN
+
     def __init__(self, side) -> None:
         """queen chess piece"""
         super().__init__(side)
-    
-    def __str__(self) -> str:
-        return "Q" if self.side == "white" else "q"
 
 class King(Piece):
+    __slots__ = ()
+    piece_type = KING
+
     def __init__(self, side) -> None:
         """king chess piece"""
         super().__init__(side)
-    
-    def __str__(self) -> str:
-        return "K" if self.side == "white" else "k"
 
-    def perish(self, conway) -> None:
+    def perish(self, conway) -> "str | None":
         winning_side = "white" if self.side == "black" else "black"
         losing_side = "Black" if self.side == "black" else "White"
-        if conway:
-            raise Exception(f"{losing_side} king perished, {winning_side} wins!")
-        else:
-            raise Exception(f"{losing_side} king was captured, {winning_side} wins!")
+        verb = "perished" if conway else "was captured"
+        return f"{losing_side} king {verb}, {winning_side} wins!"
+
+
+# constructor dispatch table for births, keyed by the birth queue characters
+_PIECE_CTORS = {"P": Pawn, "R": Rook, "N": Knight, "B": Bishop, "Q": Queen, "K": King}
+
+# material values for the built in search, indexed by piece_type
+PIECE_VALUES = (1, 3, 3, 5, 9, 200, 0)
+
+# display glyphs indexed by piece_type then side_bit (NO_SIDE wraps to a space)
+GLYPHS = ("Pp", "Nn", "Bb", "Rr", "Qq", "Kk", "  ")
+
+# neighbor coordinates for every square indexed by row * 8 + col, built once at
+# import so the conway counting loops don't rebuild boundary checked lists
+NEIGHBOR_COORDS = tuple(
+    tuple((row + i, col + j) for i in (-1, 0, 1) for j in (-1, 0, 1)
+          if (i or j) and 0 <= row + i < 8 and 0 <= col + j < 8)
+    for row in range(8) for col in range(8)
+)
+
+# the same neighborhoods as occupancy bitmasks, for popcount based counting
+KING_NEIGHBORS = tuple(
+    sum(1 << (row * 8 + col) for row, col in coords) for coords in NEIGHBOR_COORDS
+)
+
+
+def tick_pieces(pieces: set, empties: set, current_turn: str) -> tuple[list, list]:
+    """advance the life cycle counters for the start of current_turn in one pass
+
+    the board maintains the surrounding counts incrementally, so this only
+    reads them; only the current player's pieces and birth counters tick;
+    returns the squares due to give birth and the pieces due to die so the
+    birth/death phases don't have to rescan the whole board for them
+    """
+    births = []
+    deaths = []
+    if current_turn == "white":
+        for piece in empties:
+            if piece.surrounding_white == 3:
+                piece.birth_counter_white += 1
+                if piece.birth_counter_white == 3:
+                    births.append(piece)
+            else:
+                piece.birth_counter_white = 0
+        for piece in pieces:
+            if piece.side_bit == WHITE:
+                if piece.surrounding_white < 2 or piece.surrounding_white > 3:
+                    piece.death_counter += 1
+                else:
+                    piece.death_counter = 0
+            if piece.death_counter == 4:
+                deaths.append(piece)
+    else:
+        for piece in empties:
+            if piece.surrounding_black == 3:
+                piece.birth_counter_black += 1
+                if piece.birth_counter_black == 3:
+                    births.append(piece)
+            else:
+                piece.birth_counter_black = 0
+        for piece in pieces:
+            if piece.side_bit == BLACK:
+                if piece.surrounding_black < 2 or piece.surrounding_black > 3:
+                    piece.death_counter += 1
+                else:
+                    piece.death_counter = 0
+            if piece.death_counter == 4:
+                deaths.append(piece)
+    return births, deaths
 
 
 if __name__ == "__main__":